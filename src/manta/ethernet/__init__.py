@@ -325,12 +325,39 @@ class EthernetInterface(Elaboratable):
         if not all(isinstance(a, int) for a in addrs):
             raise TypeError("Read address must be an integer or list of integers.")
 
+        datas = []
+        for data_chunk in self._read_chunks(addrs):
+            datas += data_chunk
+
+        return datas
+
+    def read_bytes(self, addrs):
+        """
+        Read the data stored in a set of addresses on Manta's internal memory,
+        and return it as a bytes object containing each 16-bit word in
+        little-endian order. This avoids keeping a Python integer around for
+        each word, and so uses much less memory than read() for large reads.
+        Addresses must be specified as a list of integers.
+        """
+
+        # Make sure all list elements are integers
+        if not all(isinstance(a, int) for a in addrs):
+            raise TypeError("Read address must be a list of integers.")
+
+        return words_to_bytes(self._read_chunks(addrs))
+
+    def _read_chunks(self, addrs):
+        """
+        Send read requests for the provided addresses, and yield the data
+        returned by the FPGA one chunk at a time.
+        """
+
         # Send read requests, and get responses
         sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
         sock.bind((self._host_ip_addr, self._udp_port))
         chunk_size = 64  # 128
-        addr_chunks = split_into_chunks(addrs, chunk_size)
-        datas = []
+        addr_chunks = iter_chunks(addrs, chunk_size)
+        n_datas = 0
 
         for addr_chunk in addr_chunks:
             bytes_out = b""
@@ -343,13 +370,15 @@ class EthernetInterface(Elaboratable):
             data, addr = sock.recvfrom(4 * chunk_size)
 
             # Split into groups of four bytes
-            datas += [int.from_bytes(d, "little") for d in split_into_chunks(data, 4)]
+            data_chunk = [
+                int.from_bytes(d, "little") for d in iter_chunks(memoryview(data), 4)
+            ]
+            n_datas += len(data_chunk)
+            yield data_chunk
 
-        if len(datas) != len(addrs):
+        if n_datas != len(addrs):
             raise ValueError("Got less data than expected from FPGA.")
 
-        return datas
-
     def write(self, addrs, datas):
         """
         Write the provided data into the provided addresses in Manta's internal
@@ -11,9 +11,13 @@ class MemoryCore(MantaCore):
     A synthesizable module for accessing a memory. This is accomplished by
     instantiating a dual-port memory with one end tied to Manta's internal bus,
     and the other provided to user logic.
+
+    Reads from the memory are not transparent to writes. If an address is read
+    on the same clock cycle that it is written, the read returns the data
+    that was stored before the write.
     """
 
-    def __init__(self, mode, width, depth):
+    def __init__(self, mode, width, depth, lane_width=None):
         """
         Create a Memory Core with the given width and depth.
 
@@ -32,12 +36,51 @@ class MemoryCore(MantaCore):
             width (int): The width of the memory, in bits.
 
             depth (int): The depth of the memory, in entries.
+
+            lane_width (Optional[int]): The width of each of the memories that
+                the Memory Core is split into, in bits. Must be a multiple of 16.
+                If not provided, the Memory Core is implemented as a single
+                memory that is as wide as the core itself.
+
+        Raises:
+            ValueError: width or depth is not positive, or lane_width is not a
+                positive multiple of 16.
         """
+        if not width > 0:
+            raise ValueError("Width of memory core must be positive.")
+
+        if not depth > 0:
+            raise ValueError("Depth of memory core must be positive.")
+
+        if lane_width is not None:
+            if not isinstance(lane_width, int):
+                raise ValueError("Lane width of memory core must be an integer.")
+
+            if not lane_width > 0 or lane_width % 16 != 0:
+                raise ValueError(
+                    "Lane width of memory core must be a positive multiple of 16."
+                )
+
         self._mode = mode
         self._width = width
         self._depth = depth
+        self._lane_width = lane_width
+
+        # Each entry is exposed on the bus as a set of 16-bit words
+        self._n_words = ceil(self._width / 16)
+
+        # Each word of an entry is placed in its own window of the bus address
+        # space, which is as long as the memory is deep. Record the offset of
+        # each window relative to the base address of the core, and the number
+        # of address bits needed to select an entry within a window.
+        self._word_offsets = tuple(i * self._depth for i in range(self._n_words))
+        self._offset_bits = (self._depth - 1).bit_length()
 
-        self._n_mems = ceil(self._width / 16)
+        # Number of clock cycles that the bus is delayed by inside the core. This
+        # is fixed at two: one for the registered address decode, and one for the
+        # read latency of the memories. The readback logic relies on both stages
+        # existing, so this isn't configurable.
+        self._pipe_depth = 2
 
         # Bus Connections
         self.bus_i = Signal(InternalBus())
@@ -74,18 +117,32 @@ class MemoryCore(MantaCore):
                 self.user_write_enable,
             ]
 
-        # Define memories
-        n_full = self._width // 16
-        n_partial = self._width % 16
-
-        self._mems = [
-            Memory(shape=16, depth=self._depth, init=[0] * self._depth)
-            for _ in range(n_full)
-        ]
-        if n_partial > 0:
-            self._mems += [
-                Memory(shape=n_partial, depth=self._depth, init=[0] * self._depth)
-            ]
+        # Define memories, each of which holds a lane_width-wide slice of every
+        # entry. The last memory holds whatever bits remain. For each memory,
+        # also record which words of the entry it stores, and which bits of the
+        # entry these correspond to. Unless a lane width is provided, a single
+        # memory holds the entire entry.
+        lane_width = self._lane_width
+        if lane_width is None:
+            lane_width = 16 * self._n_words
+
+        self._mems = []
+        self._lanes = []
+        for i in range(ceil(self._width / lane_width)):
+            start_bit = i * lane_width
+            stop_bit = min(start_bit + lane_width, self._width)
+            words = range(start_bit // 16, ceil(stop_bit / 16))
+            self._lanes.append((words, start_bit, stop_bit))
+
+            # The bus writes to memories that hold multiple words one word at a
+            # time, so these must contain a whole number of words
+            shape = stop_bit - start_bit
+            if self._mode in ["host_to_fpga", "bidirectional"] and len(words) > 1:
+                shape = 16 * len(words)
+
+            self._mems.append(
+                Memory(shape=shape, depth=self._depth, init=[0] * self._depth)
+            )
 
     @property
     def top_level_ports(self):
@@ -93,20 +150,25 @@ class MemoryCore(MantaCore):
 
     @property
     def max_addr(self):
-        return self.base_addr + (self._depth * self._n_mems)
+        return self.base_addr + (self._depth * self._n_words)
 
     def to_config(self):
-        return {
+        config = {
             "type": "memory",
             "mode": self._mode,
             "width": self._width,
             "depth": self._depth,
         }
 
+        if self._lane_width is not None:
+            config["lane_width"] = self._lane_width
+
+        return config
+
     @classmethod
     def from_config(cls, config):
         # Check for unrecognized options
-        valid_options = ["type", "depth", "width", "mode"]
+        valid_options = ["type", "depth", "width", "mode", "lane_width"]
         for option in config:
             if option not in valid_options:
                 warn(f"Ignoring unrecognized option '{option}' in memory core.")
@@ -141,90 +203,107 @@ class MemoryCore(MantaCore):
         if mode not in ["fpga_to_host", "host_to_fpga", "bidirectional"]:
             raise ValueError("Unrecognized mode provided to memory core.")
 
-        return cls(mode, width, depth)
-
-    def _tie_mems_to_bus(self, m):
-        for i, mem in enumerate(self._mems):
-            # Compute address range corresponding to this chunk of memory
-            start_addr = self.base_addr + (i * self._depth)
-            stop_addr = start_addr + self._depth - 1
+        # Lane width is optional, and is checked by the constructor
+        lane_width = config.get("lane_width")
 
-            if self._mode == "fpga_to_host":
-                read_port = mem.read_port()
-                m.d.comb += read_port.en.eq(1)
-
-                # Throw BRAM operations into the front of the pipeline
-                with m.If(
-                    (self.bus_i.valid)
-                    & (self.bus_i.addr >= start_addr)
-                    & (self.bus_i.addr <= stop_addr)
-                ):
-                    m.d.sync += read_port.addr.eq(self.bus_i.addr - start_addr)
-
-                # Pull BRAM reads from the back of the pipeline
-                with m.If(
-                    (self._bus_pipe[2].valid)
-                    & (~self._bus_pipe[2].rw)
-                    & (self._bus_pipe[2].addr >= start_addr)
-                    & (self._bus_pipe[2].addr <= stop_addr)
-                ):
-                    m.d.sync += self.bus_o.data.eq(read_port.data)
-
-            elif self._mode == "host_to_fpga":
-                write_port = mem.write_port()
-                m.d.sync += write_port.en.eq(0)
-
-                # Throw BRAM operations into the front of the pipeline
-                with m.If(
-                    (self.bus_i.valid)
-                    & (self.bus_i.addr >= start_addr)
-                    & (self.bus_i.addr <= stop_addr)
-                ):
-                    m.d.sync += write_port.addr.eq(self.bus_i.addr - start_addr)
-                    m.d.sync += write_port.data.eq(self.bus_i.data)
-                    m.d.sync += write_port.en.eq(self.bus_i.rw)
-
-            elif self._mode == "bidirectional":
-                read_port = mem.read_port()
-                m.d.comb += read_port.en.eq(1)
+        return cls(mode, width, depth, lane_width)
 
-                write_port = mem.write_port()
-                m.d.sync += write_port.en.eq(0)
-
-                # Throw BRAM operations into the front of the pipeline
-                with m.If(
-                    (self.bus_i.valid)
-                    & (self.bus_i.addr >= start_addr)
-                    & (self.bus_i.addr <= stop_addr)
-                ):
-                    m.d.sync += read_port.addr.eq(self.bus_i.addr - start_addr)
-                    m.d.sync += write_port.addr.eq(self.bus_i.addr - start_addr)
-                    m.d.sync += write_port.data.eq(self.bus_i.data)
-                    m.d.sync += write_port.en.eq(self.bus_i.rw)
-
-                # Pull BRAM reads from the back of the pipeline
-                with m.If(
-                    (self._bus_pipe[2].valid)
-                    & (~self._bus_pipe[2].rw)
-                    & (self._bus_pipe[2].addr >= start_addr)
-                    & (self._bus_pipe[2].addr <= stop_addr)
-                ):
-                    m.d.sync += self.bus_o.data.eq(read_port.data)
+    def _tie_mems_to_bus(self, m):
+        # Compute the address relative to the start of the core once, and share
+        # it between all the memories. Addresses before the start of the core
+        # wrap around to large offsets, so a single comparison is enough to
+        # check if the address lies inside the core.
+        bus_i_offset = Signal(16)
+        m.d.comb += bus_i_offset.eq(self.bus_i.addr - self.base_addr)
+
+        in_bounds = Signal()
+        m.d.comb += in_bounds.eq(bus_i_offset < self.max_addr - self.base_addr)
+
+        # Decode the address into a one-hot vector with a bit for each word of
+        # an entry, which is zero if the address lies outside the core, along
+        # with the entry within the memory. Register the result of the address
+        # decode, so that the decode logic doesn't sit directly in front of the
+        # BRAM ports. These registers drive the address and enable inputs of the
+        # BRAM ports directly.
+        selected = Signal(self._n_words)
+        entry = Signal(self._offset_bits)
+        m.d.sync += selected.eq(0)
+
+        # If the depth is a power of two, the upper bits of the address select
+        # the word and the lower bits select the entry.
+        if self._depth == 2**self._offset_bits:
+            m.d.sync += entry.eq(bus_i_offset)
+
+            with m.If(self.bus_i.valid & in_bounds):
+                with m.Switch(bus_i_offset[self._offset_bits :]):
+                    for i in range(self._n_words):
+                        with m.Case(i):
+                            m.d.sync += selected[i].eq(1)
+
+        # Otherwise the address is compared against the start and end of each
+        # window
+        else:
+            m.d.sync += entry.eq(0)
+
+            with m.If(self.bus_i.valid & in_bounds):
+                for i, start_addr in enumerate(self._word_offsets):
+                    stop_addr = start_addr + self._depth
+                    window = (bus_i_offset >= start_addr) & (bus_i_offset < stop_addr)
+                    with m.If(window):
+                        m.d.sync += selected[i].eq(1)
+                        m.d.sync += entry.eq(bus_i_offset - start_addr)
+
+        # Delay the decoded address alongside the bus, so that data read from
+        # the BRAMs can be routed onto the bus without decoding the address again
+        selected_pipe = [selected]
+        for _ in range(1, self._pipe_depth):
+            selected_pipe.append(Signal(self._n_words))
+            m.d.sync += selected_pipe[-1].eq(selected_pipe[-2])
+
+        for mem, (words, start_bit, stop_bit) in zip(self._mems, self._lanes):
+            mem_selected = selected[words.start : words.stop]
+
+            # Throw BRAM operations into the front of the pipeline. Only the
+            # BRAM targeted by the transaction is enabled, so the other BRAMs
+            # in the core don't toggle their ports on every cycle.
+            if self._mode in ["fpga_to_host", "bidirectional"]:
+                read_port = mem.read_port(transparent_for=())
+                m.d.comb += read_port.addr.eq(entry)
+                m.d.comb += read_port.en.eq(mem_selected.any() & ~self._bus_pipe[0].rw)
+
+            if self._mode in ["host_to_fpga", "bidirectional"]:
+                granularity = 16 if len(words) > 1 else None
+                write_port = mem.write_port(granularity=granularity)
+                m.d.comb += write_port.addr.eq(entry)
+                m.d.comb += write_port.data.eq(
+                    self._bus_pipe[0].data.replicate(len(words))
+                )
+                m.d.comb += write_port.en.eq(Mux(self._bus_pipe[0].rw, mem_selected, 0))
+
+            # Pull BRAM reads from the back of the pipeline. The read port holds
+            # its output while disabled, so the data is still valid here. Any
+            # bits used to pad the memory out to a whole number of words are
+            # masked off.
+            if self._mode in ["fpga_to_host", "bidirectional"]:
+                read_data = read_port.data[: stop_bit - start_bit]
+                for j, word in enumerate(words):
+                    with m.If(selected_pipe[-1][word] & ~self._bus_pipe[-1].rw):
+                        m.d.sync += self.bus_o.data.eq(read_data[16 * j : 16 * (j + 1)])
 
     def _tie_mems_to_user_logic(self, m):
         # Handle write ports
         if self._mode in ["fpga_to_host", "bidirectional"]:
-            for i, mem in enumerate(self._mems):
+            for mem, (_, start_bit, stop_bit) in zip(self._mems, self._lanes):
                 write_port = mem.write_port()
                 m.d.comb += write_port.addr.eq(self.user_addr)
-                m.d.comb += write_port.data.eq(self.user_data_in[16 * i : 16 * (i + 1)])
+                m.d.comb += write_port.data.eq(self.user_data_in[start_bit:stop_bit])
                 m.d.comb += write_port.en.eq(self.user_write_enable)
 
         # Handle read ports
         if self._mode in ["host_to_fpga", "bidirectional"]:
             read_datas = []
-            for i, mem in enumerate(self._mems):
-                read_port = mem.read_port()
+            for mem in self._mems:
+                read_port = mem.read_port(transparent_for=())
                 m.d.comb += read_port.addr.eq(self.user_addr)
                 m.d.comb += read_port.en.eq(1)
                 read_datas.append(read_port.data)
@@ -238,14 +317,15 @@ class MemoryCore(MantaCore):
         for i, mem in enumerate(self._mems):
             m.submodules[f"mem_{i}"] = mem
 
-        # Pipeline the bus to accomodate the two clock-cycle delay in the memories
-        self._bus_pipe = [Signal(InternalBus()) for _ in range(3)]
+        # Pipeline the bus to accomodate the delay of the registered address
+        # decode and the memories
+        self._bus_pipe = [Signal(InternalBus()) for _ in range(self._pipe_depth)]
         m.d.sync += self._bus_pipe[0].eq(self.bus_i)
 
-        for i in range(1, 3):
+        for i in range(1, self._pipe_depth):
             m.d.sync += self._bus_pipe[i].eq(self._bus_pipe[i - 1])
 
-        m.d.sync += self.bus_o.eq(self._bus_pipe[2])
+        m.d.sync += self.bus_o.eq(self._bus_pipe[-1])
 
         self._tie_mems_to_bus(m)
         self._tie_mems_to_user_logic(m)
@@ -255,18 +335,14 @@ class MemoryCore(MantaCore):
         """
         Convert user address space to bus address space. For instance, for a
         core with base address 10 and width 33, reading from address 4 is
-        actually a read from address 14 and address 14 + depth, and address
-        14 + (2 * depth).
+        actually a read from address 14 and address 14 + stride, and address
+        14 + (2 * stride), where stride is the depth of the core.
         """
         if isinstance(addrs, int):
             return self._convert_user_to_bus_addr([addrs])[0]
 
-        bus_addrs = []
-        for addr in addrs:
-            for i in range(len(self._mems)):
-                bus_addrs.append(self.base_addr + addr + (i * self._depth))
-
-        return bus_addrs
+        offsets = [self.base_addr + offset for offset in self._word_offsets]
+        return [addr + offset for addr in addrs for offset in offsets]
 
     def read(self, addrs):
         """
@@ -298,10 +374,21 @@ class MemoryCore(MantaCore):
         if not all(isinstance(a, int) for a in addrs):
             raise TypeError("Read address must be an integer or list of integers.")
 
+        # Each entry in cores 16 bits wide or narrower is stored in a single bus
+        # word, so the data read from the bus can be returned as-is
+        if self._n_words == 1:
+            return self.interface.read([self.base_addr + a for a in addrs])
+
         bus_addrs = self._convert_user_to_bus_addr(addrs)
-        datas = self.interface.read(bus_addrs)
-        data_chunks = split_into_chunks(datas, self._n_mems)
-        return [words_to_value(chunk) for chunk in data_chunks]
+
+        # Prefer reading the data as bytes if the interface supports it, which
+        # avoids creating an integer for every word read from the core
+        if hasattr(self.interface, "read_bytes"):
+            datas = self.interface.read_bytes(bus_addrs)
+        else:
+            datas = self.interface.read(bus_addrs)
+
+        return words_to_values(datas, self._n_words)
 
     def write(self, addrs, datas):
         """
@@ -345,5 +432,5 @@ class MemoryCore(MantaCore):
             raise TypeError("Write data must all be integers.")
 
         bus_addrs = self._convert_user_to_bus_addr(addrs)
-        bus_datas = [word for d in datas for word in value_to_words(d, self._n_mems)]
+        bus_datas = [word for d in datas for word in value_to_words(d, self._n_words)]
         self.interface.write(bus_addrs, bus_datas)
@@ -207,6 +207,33 @@ class UARTInterface(Elaboratable):
         if not all(isinstance(a, int) for a in addrs):
             raise TypeError("Read address must be an integer or list of integers.")
 
+        datas = []
+        for data_chunk in self._read_chunks(addrs):
+            datas += data_chunk
+
+        return datas
+
+    def read_bytes(self, addrs):
+        """
+        Read the data stored in a set of addresses on Manta's internal memory,
+        and return it as a bytes object containing each 16-bit word in
+        little-endian order. This avoids keeping a Python integer around for
+        each word, and so uses much less memory than read() for large reads.
+        Addresses must be specified as a list of integers.
+        """
+
+        # Make sure all list elements are integers
+        if not all(isinstance(a, int) for a in addrs):
+            raise TypeError("Read address must be a list of integers.")
+
+        return words_to_bytes(self._read_chunks(addrs))
+
+    def _read_chunks(self, addrs):
+        """
+        Send read requests for the provided addresses, and yield the data
+        returned by the FPGA one chunk at a time.
+        """
+
         # Send read requests in chunks, and read bytes after each.
         # The input buffer exposed by the OS on most hosts isn't terribly deep,
         # so sending in chunks (instead of all at once) prevents the OS's input
@@ -214,8 +241,7 @@ class UARTInterface(Elaboratable):
         # responses instantly after it's received a request.
 
         ser = self._get_serial_device()
-        addr_chunks = split_into_chunks(addrs, self._chunk_size)
-        datas = []
+        addr_chunks = iter_chunks(addrs, self._chunk_size)
 
         for addr_chunk in addr_chunks:
             # Encode addrs into read requests
@@ -238,11 +264,8 @@ class UARTInterface(Elaboratable):
                 )
 
             # Split received bytes into individual responses and decode
-            responses = split_into_chunks(bytes_in, 7)
-            data_chunk = [self._decode_read_response(r) for r in responses]
-            datas += data_chunk
-
-        return datas
+            responses = iter_chunks(bytes_in, 7)
+            yield [self._decode_read_response(r) for r in responses]
 
     def write(self, addrs, datas):
         """
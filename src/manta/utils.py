@@ -1,5 +1,8 @@
 import os
+import sys
 from abc import ABC, abstractmethod
+from array import array
+from functools import lru_cache
 from pathlib import Path
 from random import sample
 
@@ -118,9 +121,68 @@ def words_to_value(data):
     concatenates them together in little-endian order.
     """
 
-    [check_value_fits_in_bits(d, 16) for d in data]
+    value = 0
+    for word in reversed(data):
+        check_value_fits_in_bits(word, 16)
+        value = (value << 16) | (word & 0xFFFF)
 
-    return int("".join([f"{i:016b}" for i in data[::-1]]), 2)
+    return value
+
+
+def words_to_values(data, n_words):
+    """
+    Takes a list of integers, interprets them as 16-bit integers, and
+    concatenates every group of `n_words` of them together in little-endian
+    order. This is equivalent to calling words_to_value() on each group, but
+    converts the entire list at once, which is much faster for long lists.
+
+    The words may also be provided as a bytes-like object containing each word
+    in little-endian order, in which case they are converted without creating
+    an integer for each word.
+
+    Raises a ValueError if the words can't be evenly divided into groups.
+    """
+
+    if isinstance(data, (bytes, bytearray, memoryview)):
+        buffer = memoryview(data).cast("B")
+
+    else:
+        try:
+            buffer = memoryview(words_to_bytes([data]))
+
+        # Fall back to checking each word individually, so that words which
+        # don't fit in 16 bits raise the same errors as in words_to_value()
+        except OverflowError:
+            for word in data:
+                check_value_fits_in_bits(word, 16)
+
+            buffer = memoryview(words_to_bytes([[word & 0xFFFF for word in data]]))
+
+    n_bytes = 2 * n_words
+    if len(buffer) % n_bytes != 0:
+        raise ValueError(f"Number of words must be a multiple of {n_words}.")
+
+    return [
+        int.from_bytes(buffer[i : i + n_bytes], "little")
+        for i in range(0, len(buffer), n_bytes)
+    ]
+
+
+def words_to_bytes(chunks):
+    """
+    Takes an iterable of lists of integers, interprets them as 16-bit integers,
+    and packs them all into a single bytes object, with each word stored in
+    little-endian order.
+    """
+
+    words = array("H")
+    for chunk in chunks:
+        words.extend(chunk)
+
+    if sys.byteorder == "big":
+        words.byteswap()
+
+    return words.tobytes()
 
 
 def value_to_words(data, n_words):
@@ -132,9 +194,7 @@ def value_to_words(data, n_words):
     if not isinstance(data, int) or data < 0:
         raise ValueError("Behavior is only defined for nonnegative integers.")
 
-    # Convert to binary, split into 16-bit chunks, and then convert back to list of int
-    binary = f"{data:0b}".zfill(n_words * 16)
-    return [int(binary[i : i + 16], 2) for i in range(0, 16 * n_words, 16)][::-1]
+    return [(data >> (16 * i)) & 0xFFFF for i in range(n_words)]
 
 
 def check_value_fits_in_bits(value, n_bits):
@@ -153,6 +213,18 @@ def check_value_fits_in_bits(value, n_bits):
         raise ValueError("Signed integer too large.")
 
 
+def iter_chunks(data, chunk_size):
+    """
+    Yield successive chunks of a list, where each chunk has length `chunk_size`.
+    If the list can't be evenly divided into chunks, then the last chunk will
+    have length less than `chunk_size`. Unlike split_into_chunks(), only one
+    chunk exists at a time, and chunking a memoryview doesn't copy the data.
+    """
+
+    for i in range(0, len(data), chunk_size):
+        yield data[i : i + chunk_size]
+
+
 def split_into_chunks(data, chunk_size):
     """
     Split a list into a list of lists, where each sublist has length `chunk_size`.
@@ -160,7 +232,7 @@ def split_into_chunks(data, chunk_size):
     returned list will have length less than `chunk_size`.
     """
 
-    return [data[i : i + chunk_size] for i in range(0, len(data), chunk_size)]
+    return list(iter_chunks(data, chunk_size))
 
 
 def make_build_dir_if_it_does_not_exist_already():
@@ -219,14 +291,11 @@ async def verify_register(module, ctx, addr, expected_data):
     function.
     """
 
-    # Place read transaction on the bus
-    ctx.set(module.bus_i.addr, addr)
-    ctx.set(module.bus_i.data, 0)
-    ctx.set(module.bus_i.valid, True)
-    ctx.set(module.bus_i.rw, 0)
+    # Place read transaction on the bus. The whole bus is set at once, as each
+    # call to ctx.set() has some overhead in the simulator.
+    ctx.set(module.bus_i, {"addr": addr, "data": 0, "rw": 0, "valid": 1, "last": 0})
     await ctx.tick()
-    ctx.set(module.bus_i.addr, 0)
-    ctx.set(module.bus_i.valid, 0)
+    ctx.set(module.bus_i, {"addr": 0, "data": 0, "rw": 0, "valid": 0, "last": 0})
 
     # Wait for output to be valid
     while not ctx.get(module.bus_o.valid):
@@ -244,18 +313,13 @@ async def write_register(module, ctx, addr, data):
     at `addr`.
     """
 
-    ctx.set(module.bus_i.addr, addr)
-    ctx.set(module.bus_i.data, data)
-    ctx.set(module.bus_i.rw, 1)
-    ctx.set(module.bus_i.valid, True)
+    ctx.set(module.bus_i, {"addr": addr, "data": data, "rw": 1, "valid": 1, "last": 0})
     await ctx.tick()
-    ctx.set(module.bus_i.addr, 0)
-    ctx.set(module.bus_i.data, 0)
-    ctx.set(module.bus_i.rw, 0)
-    ctx.set(module.bus_i.valid, False)
+    ctx.set(module.bus_i, {"addr": 0, "data": 0, "rw": 0, "valid": 0, "last": 0})
     await ctx.tick()
 
 
+@lru_cache(maxsize=1)
 def xilinx_tools_installed():
     """
     Return whether Vivado is installed, by checking if the VIVADO environment variable is set,
@@ -269,6 +333,7 @@ def xilinx_tools_installed():
     return ("VIVADO" in os.environ) or (which("vivado") is not None)
 
 
+@lru_cache(maxsize=1)
 def ice40_tools_installed():
     """
     Return whether the ice40 tools are installed, by checking if the YOSYS, NEXTPNR_ICE40,
@@ -82,6 +82,49 @@ def test_memory_core_dump():
         raise ValueError("Exported YAML does not match configuration!")
 
 
+def test_memory_core_lane_width_dump():
+    # Create Manta instance
+    manta = Manta()
+    manta.cores.test_core = MemoryCore(
+        mode="bidirectional",
+        width=40,
+        depth=1024,
+        lane_width=32,
+    )
+
+    # Create Temporary File
+    tf = tempfile.NamedTemporaryFile(delete=False)
+    tf.close()
+
+    # Export Manta configuration
+    manta.export_config(tf.name)
+
+    # Parse the exported YAML
+    with open(tf.name, "r") as f:
+        data = yaml.safe_load(f)
+
+    # Verify that exported YAML matches configuration
+    expected = {
+        "cores": {
+            "test_core": {
+                "type": "memory",
+                "mode": "bidirectional",
+                "width": 40,
+                "depth": 1024,
+                "lane_width": 32,
+            }
+        }
+    }
+
+    if data != expected:
+        raise ValueError("Exported YAML does not match configuration!")
+
+    # Verify that the exported configuration can be loaded back in
+    mem_core = MemoryCore.from_config(data["cores"]["test_core"])
+    if mem_core.to_config() != expected["cores"]["test_core"]:
+        raise ValueError("Imported configuration does not match export!")
+
+
 def test_logic_analyzer_core_dump():
     # Create some dummy signals to pass to the Logic Analyzer
     probe0 = Signal(1)
@@ -0,0 +1,144 @@
+from math import ceil
+from random import getrandbits
+
+import pytest
+
+from manta.ethernet import EthernetInterface
+from manta.memory_core import MemoryCore
+from manta.uart import UARTInterface
+from manta.utils import *
+
+
+class FakeInterface:
+    """
+    Stands in for a real interface, by storing the contents of Manta's internal
+    bus in a dictionary, and recording the addresses of each bus transaction.
+    """
+
+    def __init__(self):
+        self.memory = {}
+        self.read_addrs = []
+        self.write_addrs = []
+
+    def read(self, addrs):
+        self.read_addrs += addrs
+        return [self.memory.get(a, 0) for a in addrs]
+
+    def write(self, addrs, datas):
+        self.write_addrs += addrs
+        self.memory.update(zip(addrs, datas))
+
+
+class FakeBytesInterface(FakeInterface):
+    """
+    A fake interface that also supports reading data as bytes.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.bytes_read_addrs = []
+
+    def read_bytes(self, addrs):
+        self.bytes_read_addrs += addrs
+        return words_to_bytes([[self.memory.get(a, 0) for a in addrs]])
+
+
+def make_mem_core(width, depth, interface):
+    mem_core = MemoryCore("bidirectional", width, depth)
+    mem_core.base_addr = 100
+    mem_core.interface = interface
+    return mem_core
+
+
+def test_read_prefers_read_bytes():
+    interface = FakeBytesInterface()
+    mem_core = make_mem_core(40, 16, interface)
+    interface.memory = {100: 0x1234, 116: 0x5678, 132: 0x9A}
+
+    data = mem_core.read(0)
+    if data != 0x9A_5678_1234:
+        raise ValueError(f"Read {data:#x} from address 0")
+
+    if interface.read_addrs:
+        raise ValueError("Read words with read() despite read_bytes() existing")
+
+    if interface.bytes_read_addrs != [100, 116, 132]:
+        raise ValueError(f"Read from bus addresses {interface.bytes_read_addrs}")
+
+
+def test_read_falls_back_to_read():
+    interface = FakeInterface()
+    mem_core = make_mem_core(40, 16, interface)
+    interface.memory = {100: 0x1234, 116: 0x5678, 132: 0x9A}
+
+    data = mem_core.read(0)
+    if data != 0x9A_5678_1234:
+        raise ValueError(f"Read {data:#x} from address 0")
+
+    if interface.read_addrs != [100, 116, 132]:
+        raise ValueError(f"Read from bus addresses {interface.read_addrs}")
+
+
+def test_interface_read_bytes():
+    uart = UARTInterface(port="/dev/ttyUSB0", baudrate=115200, clock_freq=100e6)
+    ethernet = EthernetInterface(
+        fpga_ip_addr="192.168.0.101",
+        host_ip_addr="192.168.0.100",
+        udp_port=2000,
+        phy="LiteEthPHYRMII",
+        clk_freq=50e6,
+        refclk_freq=50e6,
+        vendor="xilinx",
+        toolchain="vivado",
+    )
+
+    words = [getrandbits(16) for _ in range(100)]
+    for interface in [uart, ethernet]:
+        # Skip talking to a real FPGA, and have every read return the same data
+        interface._read_chunks = lambda addrs: split_into_chunks(words, 7)
+
+        data = interface.read_bytes(list(range(100)))
+        if data != words_to_bytes([words]):
+            raise ValueError(f"read_bytes() returned {data!r}")
+
+        if interface.read(list(range(100))) != words:
+            raise ValueError("read() and read_bytes() don't agree")
+
+
+@pytest.mark.parametrize("interface_class", [FakeInterface, FakeBytesInterface])
+@pytest.mark.parametrize("width", [1, 12, 16, 17, 40, 64])
+def test_write_then_read(interface_class, width):
+    interface = interface_class()
+    mem_core = make_mem_core(width, 24, interface)
+    n_words = ceil(width / 16)
+
+    # Each word of an entry is placed in its own window, as long as the depth
+    stride = 24
+    datas = [getrandbits(width) for _ in range(24)]
+
+    # Write and read a single address
+    mem_core.write(5, datas[5])
+    expected_addrs = [100 + 5 + i * stride for i in range(n_words)]
+    if interface.write_addrs != expected_addrs:
+        raise ValueError(f"Wrote to bus addresses {interface.write_addrs}")
+
+    data = mem_core.read(5)
+    if data != datas[5]:
+        raise ValueError(f"Read {data} from address 5 instead of {datas[5]}")
+
+    bus_read_addrs = interface.read_addrs + getattr(interface, "bytes_read_addrs", [])
+    if bus_read_addrs != expected_addrs:
+        raise ValueError(f"Read from bus addresses {bus_read_addrs}")
+
+    # Write and read a list of addresses
+    addrs = list(range(24))
+    mem_core.write(addrs, datas)
+
+    if mem_core.read(addrs) != datas:
+        raise ValueError("Data read from the core doesn't match data written")
+
+    # Check every word landed in the right place on the bus
+    for addr, data in zip(addrs, datas):
+        for i, word in enumerate(value_to_words(data, n_words)):
+            if interface.memory[100 + addr + i * stride] != word:
+                raise ValueError(f"Word {i} of address {addr} is in the wrong place")
@@ -3,6 +3,7 @@ from random import choice, getrandbits, randint
 
 import pytest
 
+from manta.manta import Manta
 from manta.memory_core import MemoryCore
 from manta.utils import *
 
@@ -17,9 +18,15 @@ class MemoryCoreTests:
         self.n_full = self.width // 16
         self.n_mems = ceil(self.width / 16)
 
-        self.bus_addrs = list(
-            range(self.base_addr, self.max_addr)
-        )  # include the endpoint!
+        # Each memory occupies a window of the bus address space that's as long
+        # as the memory is deep
+        self.stride = self.depth
+
+        self.bus_addrs = [
+            self.base_addr + (i * self.stride) + addr
+            for i in range(self.n_mems)
+            for addr in range(self.depth)
+        ]
         self.user_addrs = list(range(self.mem_core._depth))
 
         # A model of what each bus address contains
@@ -96,7 +103,7 @@ class MemoryCoreTests:
 
             # verify contents when read out from the bus
             for i in range(self.n_mems):
-                bus_addr = self.base_addr + user_addr + (i * self.depth)
+                bus_addr = self.base_addr + user_addr + (i * self.stride)
                 await self.verify_bus_side(bus_addr)
 
     async def multi_user_write_then_multi_bus_reads(self):
@@ -115,7 +122,7 @@ class MemoryCoreTests:
         for _ in range(5):
             for user_addr in jumble(self.user_addrs):
                 bus_addrs = [
-                    self.base_addr + user_addr + (i * self.depth)
+                    self.base_addr + user_addr + (i * self.stride)
                     for i in range(self.n_mems)
                 ]
 
@@ -140,7 +147,7 @@ class MemoryCoreTests:
             words = value_to_words(data, self.n_mems)
 
             for i, word in enumerate(words):
-                bus_addr = self.base_addr + user_addr + (i * self.depth)
+                bus_addr = self.base_addr + user_addr + (i * self.stride)
                 await self.write_bus_side(bus_addr, word)
 
             await self.verify_user_side(user_addr)
@@ -162,7 +169,7 @@ class MemoryCoreTests:
 
             # write random data to random bus address
             if operation == "write":
-                bus_addr = randint(self.base_addr, self.max_addr - 1)
+                bus_addr = choice(self.bus_addrs)
                 data_width = self.get_data_width(bus_addr)
                 data = getrandbits(data_width)
 
@@ -207,7 +214,7 @@ class MemoryCoreTests:
         # 16-bits wide. so we'll have to calculate how wide our
         # memory is
 
-        if addr < self.base_addr + (self.n_full * self.depth):
+        if addr < self.base_addr + (self.n_full * self.stride):
             return 16
         else:
             return self.width % 16
@@ -228,7 +235,7 @@ class MemoryCoreTests:
         # Convert to bus addresses:
         bus_words = []
         for i in range(self.n_mems):
-            bus_addr = self.base_addr + addr + (i * self.depth)
+            bus_addr = self.base_addr + addr + (i * self.stride)
             bus_words.append(self.model[bus_addr])
 
         expected_data = words_to_value(bus_words)
@@ -246,7 +253,7 @@ class MemoryCoreTests:
         # convert value to words, and save to self.model
         words = value_to_words(data, self.n_mems)
         for i, word in enumerate(words):
-            bus_addr = self.base_addr + addr + (i * self.depth)
+            bus_addr = self.base_addr + addr + (i * self.stride)
             self.model[bus_addr] = word
 
         self.ctx.set(self.mem_core.user_addr, addr)
@@ -259,8 +266,8 @@ class MemoryCoreTests:
 
 
 modes = ["bidirectional", "fpga_to_host", "host_to_fpga"]
-widths = [23, randint(0, 128)]
-depths = [512, randint(0, 1024)]
+widths = [23, randint(1, 128)]
+depths = [512, randint(1, 1024)]
 base_addrs = [0, randint(0, 32678)]
 
 cases = [
@@ -268,18 +275,14 @@ cases = [
 ]
 
 
-@pytest.mark.parametrize("mode, width, depth, base_addr", cases)
-def test_mem_core(mode, width, depth, base_addr):
-    mem_core = MemoryCore(mode, width, depth)
-    mem_core.base_addr = base_addr
-
+def run_mem_core_tests(mem_core):
     tests = MemoryCoreTests(mem_core)
 
     @simulate(mem_core)
     async def testbench(ctx):
         tests.set_simulation_context(ctx)
 
-        if mode == "bidirectional":
+        if mem_core._mode == "bidirectional":
             await tests.bus_addrs_all_zero()
             await tests.user_addrs_all_zero()
 
@@ -288,12 +291,85 @@ def test_mem_core(mode, width, depth, base_addr):
             await tests.bus_to_user_functionality()
             await tests.user_to_user_functionality()
 
-        if mode == "fpga_to_host":
+        if mem_core._mode == "fpga_to_host":
             await tests.bus_addrs_all_zero()
             await tests.user_to_bus_functionality()
 
-        if mode == "host_to_fpga":
+        if mem_core._mode == "host_to_fpga":
             await tests.user_addrs_all_zero()
             await tests.bus_to_user_functionality()
 
     testbench()
+
+
+@pytest.mark.parametrize("mode, width, depth, base_addr", cases)
+def test_mem_core(mode, width, depth, base_addr):
+    mem_core = MemoryCore(mode, width, depth)
+    mem_core.base_addr = base_addr
+    run_mem_core_tests(mem_core)
+
+
+lane_width_cases = [(m, w, lw) for m in modes for w in [40, 70] for lw in [16, 32, 64]]
+
+
+@pytest.mark.parametrize("mode, width, lane_width", lane_width_cases)
+def test_mem_core_lane_width(mode, width, lane_width):
+    mem_core = MemoryCore(mode, width, 64, lane_width)
+    mem_core.base_addr = randint(0, 32678)
+    run_mem_core_tests(mem_core)
+
+
+@pytest.mark.parametrize(
+    "width, depth, base_addr", [(40, 100, 0), (40, 128, 0), (40, 100, (2**16) - 301)]
+)
+def test_mem_core_address_decode(width, depth, base_addr):
+    # Cores with power-of-two and other depths decode addresses differently,
+    # so check both, including right up against the end of the address space
+    mem_core = MemoryCore("bidirectional", width, depth)
+    mem_core.base_addr = base_addr
+    run_mem_core_tests(mem_core)
+
+
+@pytest.mark.parametrize(
+    "cores",
+    [
+        [(16, 1000), (48, 20000)],
+        [(16, 1000), (16, 40000)],
+        [(16, 1000), (32, 17000)],
+        [(32, 17000), (16, 20000)],
+        [(16, 1000), (16, 64534)],
+    ],
+)
+def test_mem_core_allocation_near_address_limit(cores):
+    # Each core should take up exactly as many bus addresses as it has words,
+    # so that cores allocated after it still fit
+    manta = Manta()
+    base_addr = 0
+    for i, (width, depth) in enumerate(cores):
+        mem_core = MemoryCore("bidirectional", width, depth)
+        setattr(manta.cores, f"core_{i}", mem_core)
+
+        max_addr = base_addr + (ceil(width / 16) * depth)
+        if mem_core.max_addr != max_addr:
+            raise ValueError(
+                f"Core {i} ends at {mem_core.max_addr} instead of {max_addr}"
+            )
+
+        base_addr = max_addr + 1
+
+
+@pytest.mark.parametrize("lane_width", [0, -16, 20, 24.0, "32"])
+def test_mem_core_rejects_bad_lane_width(lane_width):
+    with pytest.raises(ValueError, match="Lane width"):
+        MemoryCore("bidirectional", 40, 16, lane_width)
+
+    config = {
+        "type": "memory",
+        "mode": "bidirectional",
+        "width": 40,
+        "depth": 16,
+        "lane_width": lane_width,
+    }
+
+    with pytest.raises(ValueError, match="Lane width"):
+        MemoryCore.from_config(config)
@@ -0,0 +1,58 @@
+from math import ceil
+from random import getrandbits
+
+import pytest
+
+from manta.utils import *
+
+
+def test_words_to_bytes():
+    data = words_to_bytes([[0x0001, 0x1234], [], [0xFFFF]])
+
+    if data != b"\x01\x00\x34\x12\xff\xff":
+        raise ValueError(f"Packed words into {data!r}")
+
+
+def test_words_to_values_accepts_bytes():
+    words = [0x0001, 0x1234, 0xABCD, 0xFFFF, 0x0000, 0x8000]
+    expected = [0x1234_0001, 0xFFFF_ABCD, 0x8000_0000]
+
+    for data in [words, words_to_bytes([words]), bytearray(words_to_bytes([words]))]:
+        values = words_to_values(data, 2)
+        if values != expected:
+            raise ValueError(f"Converted {data!r} to {values} instead of {expected}")
+
+
+@pytest.mark.parametrize("width", [17, 64, 100])
+def test_words_to_values_matches_words_to_value(width):
+    n_words = ceil(width / 16)
+    values = [getrandbits(width) for _ in range(50)]
+    words = [word for v in values for word in value_to_words(v, n_words)]
+
+    expected = [words_to_value(c) for c in split_into_chunks(words, n_words)]
+    if words_to_values(words, n_words) != expected:
+        raise ValueError("words_to_values() doesn't match words_to_value()")
+
+    if expected != values:
+        raise ValueError("Words don't convert back into the original values")
+
+
+def test_words_to_values_accepts_negative_words():
+    # Negative words are interpreted the same way as in words_to_value()
+    values = words_to_values([1, -2], 2)
+    if values != [words_to_value([1, -2])]:
+        raise ValueError(f"Converted negative words to {values}")
+
+
+def test_words_to_values_rejects_bad_words():
+    with pytest.raises(ValueError, match="Unsigned integer too large"):
+        words_to_values([1, 2**16], 2)
+
+    with pytest.raises(ValueError, match="Signed integer too large"):
+        words_to_values([1, -(2**16)], 2)
+
+    with pytest.raises(ValueError, match="multiple of 2"):
+        words_to_values([1, 2, 3], 2)
+
+    with pytest.raises(ValueError, match="multiple of 2"):
+        words_to_values(b"\x01\x00\x02\x00\x03\x00", 2)